@@ -9,57 +9,217 @@ Python Version: 3.14+
 
 import os
 import io
-import json
-from typing import Dict, List, Union, Optional
-from flask import Flask, render_template, request, jsonify, flash, redirect, url_for, session
+import tempfile
+import bisect
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, BinaryIO, Dict, Iterator, List, TextIO, Tuple, Union
+import orjson
+from flask import Flask, Response, render_template, request, jsonify, flash, redirect, url_for, session, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_session import Session
+from cachelib.file import FileSystemCache
+from cachelib.serializers import FileSystemSerializer
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
-import rispy
+import fast_ris
 from citation_formatter import CitationFormatter, CitationStyle
-from url_metadata import URLMetadataExtractor
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider using orjson for API responses, request bodies and templates"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+class OrjsonSessionSerializer(FileSystemSerializer):
+    """Store session files as orjson instead of pickle"""
+    
+    def dump(self, value: Any, f, *args: Any, **kwargs: Any) -> None:
+        f.write(orjson.dumps(value))
+    
+    def load(self, f) -> Any:
+        try:
+            return orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
+            self._warn(e)
+            return None
+
+class SessionFileCache(FileSystemCache):
+    """File cache for server-side sessions, serialized with orjson"""
+    serializer = OrjsonSessionSerializer()
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Session storage backend:
+#   redis      - server-side, shared by every instance (use this for Vercel/Lambda)
+#   filesystem - server-side files, only for a single long-running server
+#   cookie     - Flask's signed cookie; works anywhere but is limited to ~4KB of references
+# Defaults to redis when REDIS_URL is set, cookie on serverless platforms, else filesystem.
+_SERVERLESS = bool(os.environ.get('VERCEL') or os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND') or (
+    'redis' if os.environ.get('REDIS_URL') else 'cookie' if _SERVERLESS else 'filesystem'
+)
+
+if SESSION_BACKEND == 'redis':
+    import redis
+    if not os.environ.get('REDIS_URL'):
+        raise Exception("SESSION_BACKEND=redis requires REDIS_URL")
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.from_url(os.environ['REDIS_URL'])
+elif SESSION_BACKEND == 'filesystem':
+    # Once more than threshold files exist, expired sessions and then the oldest are
+    # deleted on the next write; 0 disables pruning
+    app.config['SESSION_TYPE'] = 'cachelib'
+    app.config['SESSION_CACHELIB'] = SessionFileCache(
+        cache_dir=os.environ.get('SESSION_FILE_DIR', os.path.join(tempfile.gettempdir(), 'ris-reference-sorter-sessions')),
+        threshold=int(os.environ.get('SESSION_FILE_THRESHOLD', '500'))
+    )
+elif SESSION_BACKEND != 'cookie':
+    raise Exception(f"Unknown SESSION_BACKEND: {SESSION_BACKEND}")
+
+# Stored libraries expire this long after the session was last used, since the
+# browser-session cookie pointing at them is gone once the browser closes
+SESSION_LIFETIME_HOURS = int(os.environ.get('SESSION_LIFETIME_HOURS', '12'))
+app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=SESSION_LIFETIME_HOURS)
+
+if SESSION_BACKEND != 'cookie':
+    # Server-side sessions: only the session id travels in the cookie
+    app.config['SESSION_PERMANENT'] = False
+    Session(app)
+
 ALLOWED_EXTENSIONS = {'ris', 'txt'}
+_ALLOWED_SUFFIXES = tuple(f'.{ext}' for ext in sorted(ALLOWED_EXTENSIONS))
+
+# RIS reference type to BibTeX entry type
+_BIBTEX_TYPE_MAP = {
+    'JOUR': 'article',
+    'BOOK': 'book',
+    'CHAP': 'incollection',
+    'CONF': 'inproceedings',
+    'THES': 'phdthesis',
+    'RPRT': 'techreport'
+}
+
+# Shared pool for parsing multi-file uploads concurrently
+_PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ris-parse')
 
 def allowed_file(filename: str) -> bool:
     """Check if file has allowed extension"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+# Citation style values to members, so unknown styles fall back without raising
+_STYLE_LOOKUP = {style.value: style for style in CitationStyle}
+
+def _resolve_style(style_str: str) -> CitationStyle:
+    """Map a style name to a CitationStyle, defaulting to APA"""
+    return _STYLE_LOOKUP.get(str(style_str).lower(), CitationStyle.APA)
+
+def _compute_keys(ref: Dict) -> Tuple[str, str]:
+    """Sort key and dedup key for a reference, reading each field only once"""
+    # Sort by first author's last name, else the title; dedup on title + year + authors
+    title = ref.get('title', '')
+    authors = ref.get('authors', [])
+    sort_key = authors[0].split(',')[0].strip().lower() if authors else title.lower()
+    # Joined with a control character so the key survives JSON session storage
+    dedup_key = '\x1f'.join((title.casefold(), str(ref.get('year', '')), *(author.casefold() for author in authors)))
+    return sort_key, dedup_key
+
+# Keys _with_keys() adds; recomputed on demand when missing
+_DERIVED_KEYS = frozenset(('_sort_key', '_dedup_key'))
+
+def _with_keys(ref: Dict) -> Dict:
+    """Compute the sort and dedup keys once and store them as '_sort_key' / '_dedup_key'"""
+    ref['_sort_key'], ref['_dedup_key'] = _compute_keys(ref)
+    return ref
+
+def _stored_sort_key(ref: Dict) -> str:
+    """Read the precomputed sort key (computed on the fly for references stored before it existed)"""
+    key = ref.get('_sort_key')
+    return _compute_keys(ref)[0] if key is None else key
+
+def _stored_dedup_key(ref: Dict) -> str:
+    """Read the precomputed dedup key (computed on the fly for references stored before it existed)"""
+    key = ref.get('_dedup_key')
+    return _compute_keys(ref)[1] if key is None else key
+
+def _store_references(references: List[Dict]) -> None:
+    """Save the library in the session; cookie sessions drop the derived keys to fit more references in ~4KB"""
+    if SESSION_BACKEND == 'cookie':
+        references = [{key: value for key, value in ref.items() if key not in _DERIVED_KEYS} for ref in references]
+    session['references'] = references
+
+def _add_unique(references: List[Dict], seen: set, unique_refs: List[Dict]) -> int:
+    """Append references whose key has not been seen yet; return the number of duplicates skipped"""
+    duplicates = 0
+    mark_seen = seen.add
+    keep = unique_refs.append
+    for ref in references:
+        key = ref.get('_dedup_key')
+        if key is None:
+            key = _compute_keys(ref)[1]
+        if key in seen:
+            duplicates += 1
+            continue
+        mark_seen(key)
+        keep(ref)
+    return duplicates
+
+def _sort_references(references: List[Dict]) -> List[Dict]:
+    """Sort references alphabetically by their precomputed sort key"""
+    return sorted(references, key=_stored_sort_key)
+
+def _insert_sorted(references: List[Dict], ref: Dict) -> None:
+    """Insert a reference into an already sorted list without re-sorting it"""
+    bisect.insort(references, ref, key=_stored_sort_key)
 
 def format_reference(entry: Dict[str, Union[str, List[str], int]], style: CitationStyle = CitationStyle.APA) -> str:
     """Convert RIS entry to formatted citation using specified style"""
-    return CitationFormatter.format(entry, style)
+    return CitationFormatter.format_cached(entry, style)
 
+@lru_cache(maxsize=None)
+def _url_extractor():
+    """Shared URL extractor so lookups reuse its pooled HTTP connections"""
+    # Imported on first use: url_metadata pulls in requests, which other routes never need
+    from url_metadata import URLMetadataExtractor
+    return URLMetadataExtractor()
 
-def parse_ris_file(file_content: bytes, encoding: str = 'utf-8', style: CitationStyle = CitationStyle.APA) -> List[Dict]:
-    """Parse RIS file content and return list of reference dictionaries"""
-    references = []
-    
+def format_references(references: List[Dict], style: CitationStyle = CitationStyle.APA) -> List[str]:
+    """Format a list of references with the memoized formatter"""
+    return [format_reference(ref, style) for ref in references]
+
+
+def parse_ris_stream(text_stream: TextIO, style: CitationStyle = CitationStyle.APA) -> List[Dict]:
+    """Parse RIS entries line by line from a text stream"""
+    return fast_ris.load(text_stream)
+
+
+def _parse_binary_stream(binary_stream: BinaryIO, encoding: str, style: CitationStyle) -> List[Dict]:
+    """Decode a binary upload stream on the fly and parse it"""
+    text_stream = io.TextIOWrapper(binary_stream, encoding=encoding)
     try:
-        # Decode file content
-        if isinstance(file_content, bytes):
-            text_content = file_content.decode(encoding)
-        else:
-            text_content = file_content
-            
-        # Create StringIO object for rispy
-        file_like = io.StringIO(text_content)
-        entries = rispy.load(file_like)
-            
-        for entry in entries:
-            references.append(entry)
-                
+        return parse_ris_stream(text_stream, style)
+    finally:
+        # Detach so the wrapper does not close the underlying upload stream
+        text_stream.detach()
+
+
+def parse_ris_file(file: FileStorage, encoding: str = 'utf-8', style: CitationStyle = CitationStyle.APA) -> List[Dict]:
+    """Parse an uploaded RIS file and return list of reference dictionaries"""
+    try:
+        references = _parse_binary_stream(file.stream, encoding, style)
     except UnicodeDecodeError:
-        # Try different encodings
+        # Rewind and try a different encoding
         if encoding != 'latin-1':
             try:
-                text_content = file_content.decode('latin-1') if isinstance(file_content, bytes) else file_content
-                file_like = io.StringIO(text_content)
-                entries = rispy.load(file_like)
-                
-                for entry in entries:
-                    references.append(entry)
+                file.stream.seek(0)
+                references = _parse_binary_stream(file.stream, 'latin-1', style)
             except Exception as e:
                 raise Exception(f"Could not parse RIS file: {str(e)}")
         else:
@@ -69,6 +229,14 @@ def parse_ris_file(file_content: bytes, encoding: str = 'utf-8', style: Citation
     
     return references
 
+def _parse_one(file: FileStorage, style: CitationStyle) -> Tuple[str, Union[List[Dict], Exception]]:
+    """Parse one uploaded file, returning its name with the references or the error raised"""
+    try:
+        references = parse_ris_file(file, style=style)
+    except Exception as e:
+        return file.filename, e
+    return file.filename, [_with_keys(ref) for ref in references]
+
 @app.route('/')
 def index():
     """Main page with file upload form"""
@@ -77,12 +245,9 @@ def index():
     
     # If there are references, show them
     if current_references:
-        try:
-            style = CitationStyle(current_style.lower())
-        except ValueError:
-            style = CitationStyle.APA
+        style = _resolve_style(current_style)
         
-        formatted_refs = [format_reference(ref, style) for ref in current_references]
+        formatted_refs = format_references(current_references, style)
         
         stats = {
             'total_files': 0,
@@ -113,10 +278,7 @@ def upload_files():
     
     # Get citation style
     style_str = request.form.get('citation_style', session.get('citation_style', 'apa'))
-    try:
-        style = CitationStyle(style_str.lower())
-    except ValueError:
-        style = CitationStyle.APA
+    style = _resolve_style(style_str)
     
     session['citation_style'] = style.value
     
@@ -131,81 +293,68 @@ def upload_files():
         flash('No files selected')
         return redirect(url_for('index'))
     
-    new_references = []
     processed_files = []
     errors = []
     
-    # Process each uploaded file (in-memory for serverless compatibility)
+    # Duplicates are dropped as references arrive; when merging, the
+    # existing references seed the set of seen keys
+    merging = bool(merge_mode and current_references)
+    seen = set()
+    unique_refs = []
+    duplicates_removed = _add_unique(current_references, seen, unique_refs) if merging else 0
+    new_references_count = 0
+    
+    valid_files = []
     for file in files:
-        if file and file.filename and allowed_file(file.filename):
-            try:
-                filename = secure_filename(file.filename)
-                
-                # Read file content into memory
-                file_content = file.read()
-                
-                # Parse the RIS file from memory (returns list of dicts)
-                references = parse_ris_file(file_content, style=style)
-                new_references.extend(references)
-                processed_files.append(filename)
-                
-            except Exception as e:
-                errors.append(f"Error processing {file.filename}: {str(e)}")
+        filename = file.filename
+        if filename and allowed_file(filename):
+            valid_files.append(file)
+        else:
+            errors.append(f"Invalid file type: {filename}. Only .ris and .txt files are allowed.")
+    
+    # Stream each upload through the parser (streamed for serverless compatibility);
+    # several files are parsed concurrently, results come back in upload order
+    parse = partial(_parse_one, style=style)
+    if len(valid_files) > 1:
+        results = _PARSE_EXECUTOR.map(parse, valid_files)
+    else:
+        results = map(parse, valid_files)
+    
+    for original_name, result in results:
+        if isinstance(result, Exception):
+            errors.append(f"Error processing {original_name}: {str(result)}")
         else:
-            errors.append(f"Invalid file type: {file.filename}. Only .ris and .txt files are allowed.")
+            new_references_count += len(result)
+            duplicates_removed += _add_unique(result, seen, unique_refs)
+            processed_files.append(secure_filename(original_name))
     
-    if not new_references:
+    if not new_references_count:
         flash('No valid references found in uploaded files')
         return redirect(url_for('index'))
     
-    # Handle merge or new mode
-    if merge_mode and current_references:
-        # Merge with existing references
-        all_references = current_references + new_references
-        operation_mode = "merged"
-    else:
-        # Start fresh with new references
-        all_references = new_references
-        operation_mode = "new"
-    
-    # Remove duplicates based on a unique identifier (title + authors + year)
-    seen = set()
-    unique_refs = []
-    for ref in all_references:
-        authors = tuple(ref.get('authors', []))
-        title = ref.get('title', '')
-        year = ref.get('year', '')
-        key = (title.lower(), tuple(authors), str(year))
-        if key not in seen:
-            seen.add(key)
-            unique_refs.append(ref)
+    # Merged with existing references or started fresh with new ones
+    operation_mode = "merged" if merging else "new"
     
     # Sort references alphabetically by first author
-    def get_ref_sort_key(ref: Dict) -> str:
-        authors = ref.get('authors', [])
-        if authors:
-            return authors[0].split(',')[0].strip().lower()
-        return ref.get('title', '').lower()
-    
-    sorted_refs = sorted(unique_refs, key=get_ref_sort_key)
+    sorted_refs = _sort_references(unique_refs)
     
     # Update session storage (store as dicts, not formatted strings)
-    session['references'] = sorted_refs
+    _store_references(sorted_refs)
     
     # Format references for display
-    formatted_refs = [format_reference(ref, style) for ref in sorted_refs]
+    formatted_refs = format_references(sorted_refs, style)
     
     # Statistics
     stats = {
         'total_files': len(processed_files),
-        'total_references': len(all_references),
+        'total_references': len(unique_refs) + duplicates_removed,
         'unique_references': len(unique_refs),
-        'duplicates_removed': len(all_references) - len(unique_refs),
+        'duplicates_removed': duplicates_removed,
         'processed_files': processed_files,
         'errors': errors,
         'operation_mode': operation_mode,
-        'new_references_count': len(new_references),
-        'existing_references_count': len(current_references) - len(new_references) if merge_mode else 0,
+        'new_references_count': new_references_count,
+        'existing_references_count': len(current_references) - new_references_count if merge_mode else 0,
         'citation_style': style.value
     }
     
@@ -225,15 +374,11 @@ def add_url_citation():
         url = 'https://' + url
     
     style_str = data.get('style', session.get('citation_style', 'apa'))
-    try:
-        style = CitationStyle(style_str.lower())
-    except ValueError:
-        style = CitationStyle.APA
+    style = _resolve_style(style_str)
     
     # Extract metadata from URL
-    extractor = URLMetadataExtractor()
     try:
-        reference_entry = extractor.extract(url)
+        reference_entry = _url_extractor().extract(url)
     except Exception as e:
         # Fallback if extraction fails
         reference_entry = {
@@ -248,41 +393,28 @@ def add_url_citation():
     
     # Ensure URL is set
     reference_entry['url'] = url
+    _with_keys(reference_entry)
     
-    # Get current references
+    # Get current references (already sorted and de-duplicated)
     current_references = session.get('references', [])
-    current_references.append(reference_entry)
     
-    # Remove duplicates
-    seen = set()
-    unique_refs = []
-    for ref in current_references:
-        authors = tuple(ref.get('authors', []))
-        title = ref.get('title', '')
-        year = ref.get('year', '')
-        url_ref = ref.get('url', '')
-        # Use URL as part of key to avoid duplicates from same URL
-        key = (title.lower(), tuple(authors), str(year), url_ref.lower())
-        if key not in seen:
-            seen.add(key)
-            unique_refs.append(ref)
-    
-    # Sort
-    def get_ref_sort_key(ref: Dict) -> str:
-        authors = ref.get('authors', [])
-        if authors:
-            return authors[0].split(',')[0].strip().lower()
-        return ref.get('title', '').lower()
+    # Skip duplicates; use URL as part of key to avoid duplicates from same URL
+    def get_ref_key(ref: Dict) -> Tuple[str, str]:
+        return (_stored_dedup_key(ref), ref.get('url', '').casefold())
+    
+    new_key = get_ref_key(reference_entry)
+    if not any(get_ref_key(ref) == new_key for ref in current_references):
+        # Insert at its sorted position instead of re-sorting the whole list
+        _insert_sorted(current_references, reference_entry)
     
-    sorted_refs = sorted(unique_refs, key=get_ref_sort_key)
-    session['references'] = sorted_refs
+    _store_references(current_references)
     
     formatted_ref = format_reference(reference_entry, style)
     
     return jsonify({
         'success': True,
         'reference': formatted_ref,
-        'total_count': len(sorted_refs),
+        'total_count': len(current_references),
         'metadata': {
             'title': reference_entry.get('title', ''),
             'authors': reference_entry.get('authors', []),
@@ -304,16 +436,13 @@ def delete_reference():
     
     if 0 <= index < len(current_references):
         current_references.pop(index)
-        session['references'] = current_references
+        _store_references(current_references)
         
         # Reformat references for response
         style_str = session.get('citation_style', 'apa')
-        try:
-            style = CitationStyle(style_str.lower())
-        except ValueError:
-            style = CitationStyle.APA
+        style = _resolve_style(style_str)
         
-        formatted_refs = [format_reference(ref, style) for ref in current_references]
+        formatted_refs = format_references(current_references, style)
         
         return jsonify({
             'success': True,
@@ -336,11 +465,14 @@ def current_stats():
     """Get current reference statistics"""
     current_references = session.get('references', [])
     style = session.get('citation_style', 'apa')
-    return jsonify({
+    response = jsonify({
         'count': len(current_references),
         'has_references': len(current_references) > 0,
         'style': style
     })
+    # Let clients reuse the answer briefly instead of polling Flask
+    response.headers['Cache-Control'] = 'private, max-age=5'
+    return response
 
 @app.route('/api/export', methods=['POST'])
 def export_references():
@@ -350,33 +482,37 @@ def export_references():
     format_type = data.get('format', 'text')
     style_str = data.get('style', session.get('citation_style', 'apa'))
     
-    try:
-        style = CitationStyle(style_str.lower())
-    except ValueError:
-        style = CitationStyle.APA
-    
-    # Format references according to style
-    formatted_refs = [format_reference(ref, style) for ref in reference_data]
-    
-    if format_type == 'text':
-        # Plain text format with double newlines
-        exported = '\n\n'.join(formatted_refs)
-    elif format_type == 'numbered':
-        # Numbered list
-        exported = '\n\n'.join(f"{i+1}. {ref}" for i, ref in enumerate(formatted_refs))
-    elif format_type == 'markdown':
-        # Markdown format
-        exported = '\n\n'.join(f"- {ref}" for ref in formatted_refs)
-    elif format_type == 'bibtex':
+    style = _resolve_style(style_str)
+    
+    # Stream the export one reference at a time instead of building one large string
+    return Response(
+        stream_with_context(_generate_export(format_type, reference_data, style)),
+        mimetype='text/plain'
+    )
+
+def _generate_export(format_type: str, references: List[Dict], style: CitationStyle) -> Iterator[str]:
+    """Yield exported references one at a time, separated by blank lines"""
+    if format_type == 'bibtex':
         # BibTeX format
-        exported = export_bibtex(reference_data)
+        entries = iter_bibtex(references)
     elif format_type == 'ris':
         # RIS format
-        exported = export_ris(reference_data)
+        entries = iter_ris(references)
     else:
-        exported = '\n\n'.join(formatted_refs)
+        # Format references according to style
+        formatted_refs = (format_reference(ref, style) for ref in references)
+        if format_type == 'numbered':
+            # Numbered list
+            entries = (f"{i+1}. {ref}" for i, ref in enumerate(formatted_refs))
+        elif format_type == 'markdown':
+            # Markdown format
+            entries = (f"- {ref}" for ref in formatted_refs)
+        else:
+            # Plain text format with double newlines
+            entries = formatted_refs
     
-    return jsonify({'exported_text': exported})
+    for i, entry in enumerate(entries):
+        yield f"\n\n{entry}" if i else entry
 
 @app.route('/api/change_style', methods=['POST'])
 def change_style():
@@ -384,18 +520,17 @@ def change_style():
     data = request.get_json()
     style_str = data.get('style', 'apa')
     
-    try:
-        style = CitationStyle(style_str.lower())
-    except ValueError:
-        style = CitationStyle.APA
+    style = _resolve_style(style_str)
     
     session['citation_style'] = style.value
     
     # Get current references from session
-    current_references = session.get('references', [])
+    current_references = session.get('references')
+    if not current_references:
+        return jsonify({'success': True, 'references': [], 'style': style.value})
     
     # Reformat all references
-    formatted_refs = [format_reference(ref, style) for ref in current_references]
+    formatted_refs = format_references(current_references, style)
     
     return jsonify({
         'success': True,
@@ -405,20 +540,17 @@ def change_style():
 
 def export_bibtex(references: List[Dict]) -> str:
     """Export references in BibTeX format"""
-    bibtex_entries = []
+    return '\n\n'.join(iter_bibtex(references))
+
+def iter_bibtex(references: List[Dict]) -> Iterator[str]:
+    """Yield one BibTeX entry per reference"""
+    # Loop invariants bound to locals
+    type_map_get = _BIBTEX_TYPE_MAP.get
+    join_authors = ' and '.join
     
     for i, ref in enumerate(references):
-        entry_type_map = {
-            'JOUR': 'article',
-            'BOOK': 'book',
-            'CHAP': 'incollection',
-            'CONF': 'inproceedings',
-            'THES': 'phdthesis',
-            'RPRT': 'techreport'
-        }
-        
         ref_type = ref.get('type_of_reference', 'JOUR')
-        bibtex_type = entry_type_map.get(ref_type, 'misc')
+        bibtex_type = type_map_get(ref_type, 'misc')
         
         authors = ref.get('authors', [])
         title = ref.get('title', '')
@@ -428,80 +560,79 @@ def export_bibtex(references: List[Dict]) -> str:
         pages = ref.get('start_page', '')
         doi = ref.get('doi', '')
         
-        entry = f"@{{{bibtex_type.lower()}}}{{{i+1:04d}"
+        parts = [f"@{bibtex_type}{{{i+1:04d}"]
         if authors:
-            entry += f",\n  author = {{{' and '.join(authors)}}}"
+            parts.append(f",\n  author = {{{join_authors(authors)}}}")
         if title:
-            entry += f",\n  title = {{{title}}}"
+            parts.append(f",\n  title = {{{title}}}")
         if journal:
-            entry += f",\n  journal = {{{journal}}}"
+            parts.append(f",\n  journal = {{{journal}}}")
         if year:
-            entry += f",\n  year = {{{year}}}"
+            parts.append(f",\n  year = {{{year}}}")
         if volume:
-            entry += f",\n  volume = {{{volume}}}"
+            parts.append(f",\n  volume = {{{volume}}}")
         if pages:
-            entry += f",\n  pages = {{{pages}}}"
+            parts.append(f",\n  pages = {{{pages}}}")
         if doi:
-            entry += f",\n  doi = {{{doi}}}"
-        entry += "\n}"
+            parts.append(f",\n  doi = {{{doi}}}")
+        parts.append("\n}")
         
-        bibtex_entries.append(entry)
-    
-    return '\n\n'.join(bibtex_entries)
+        yield ''.join(parts)
 
 def export_ris(references: List[Dict]) -> str:
     """Export references in RIS format"""
-    ris_entries = []
-    
+    return '\n\n'.join(iter_ris(references))
+
+def iter_ris(references: List[Dict]) -> Iterator[str]:
+    """Yield one RIS record per reference"""
     for ref in references:
         entry = []
+        append = entry.append
         ref_type = ref.get('type_of_reference', 'JOUR')
-        entry.append(f"TY  - {ref_type}")
+        append(f"TY  - {ref_type}")
         
         authors = ref.get('authors', [])
         for author in authors:
-            entry.append(f"AU  - {author}")
+            append(f"AU  - {author}")
         
         title = ref.get('title', '')
         if title:
-            entry.append(f"TI  - {title}")
+            append(f"TI  - {title}")
         
         journal = ref.get('journal_name', '') or ref.get('secondary_title', '')
         if journal:
-            entry.append(f"JO  - {journal}")
+            append(f"JO  - {journal}")
         
         year = ref.get('year', '')
         if year:
-            entry.append(f"PY  - {year}")
+            append(f"PY  - {year}")
         
         volume = ref.get('volume', '')
         if volume:
-            entry.append(f"VL  - {volume}")
+            append(f"VL  - {volume}")
         
         issue = ref.get('number', '')
         if issue:
-            entry.append(f"IS  - {issue}")
+            append(f"IS  - {issue}")
         
         pages = ref.get('start_page', '')
         if pages:
-            entry.append(f"SP  - {pages}")
+            append(f"SP  - {pages}")
         
         end_page = ref.get('end_page', '')
         if end_page:
-            entry.append(f"EP  - {end_page}")
+            append(f"EP  - {end_page}")
         
         doi = ref.get('doi', '')
         if doi:
-            entry.append(f"DO  - {doi}")
+            append(f"DO  - {doi}")
         
         url = ref.get('url', '')
         if url:
-            entry.append(f"UR  - {url}")
+            append(f"UR  - {url}")
         
-        entry.append("ER  - ")
-        ris_entries.append('\n'.join(entry))
-    
-    return '\n\n'.join(ris_entries)
+        append("ER  - ")
+        yield '\n'.join(entry)
 
 @app.route('/about')
 def about():
@@ -511,12 +642,12 @@ def about():
 @app.route('/terms')
 def terms():
     """Terms of Service page"""
-    return render_template('terms.html')
+    return render_template('terms.html', session_lifetime_hours=SESSION_LIFETIME_HOURS)
 
 @app.route('/privacy')
 def privacy():
     """Privacy Policy page"""
-    return render_template('privacy.html')
+    return render_template('privacy.html', session_lifetime_hours=SESSION_LIFETIME_HOURS)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5030) 
\ No newline at end of file
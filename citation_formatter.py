@@ -2,7 +2,10 @@
 Citation formatter module supporting multiple citation styles
 Supports: APA, MLA, Chicago, Harvard, IEEE
 """
-from typing import Dict, List, Union, Optional
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Tuple, Union, Optional
 from enum import Enum
 
 
@@ -15,311 +18,283 @@ class CitationStyle(Enum):
     IEEE = "ieee"
 
 
+# Author string used when an entry lists no authors
+_UNKNOWN = "Unknown Author"
+
+# Fields every formatter reads, looked up once per entry; authors is a tuple so a
+# prepared entry is hashable and doubles as the format_cached() key
+_PreparedEntry = namedtuple(
+    '_PreparedEntry',
+    'authors title journal year volume issue pages end_page doi url entry_type publisher city'
+)
+_make_prepared = _PreparedEntry._make
+
+
+def _prepare(entry: Union[Dict, _PreparedEntry]) -> _PreparedEntry:
+    """Read the formatter fields from an entry dict, passing prepared entries through"""
+    if isinstance(entry, _PreparedEntry):
+        return entry
+    get = entry.get
+    # Positional, in _PreparedEntry field order (cheaper than keyword construction)
+    return _make_prepared((
+        tuple(get('authors') or ()),
+        get('title', ''),
+        get('journal_name', '') or get('secondary_title', ''),
+        get('year', ''),
+        get('volume', ''),
+        get('number', ''),
+        get('start_page', ''),
+        get('end_page', ''),
+        get('doi', ''),
+        get('url', ''),
+        get('type_of_reference', 'JOUR'),
+        get('publisher', ''),
+        get('place_published', '')
+    ))
+
+
+def _template(*steps: Tuple) -> Tuple:
+    """Compile (field, prefix, suffix[, requires[, unless]]) steps to field indexes once"""
+    index = _PreparedEntry._fields.index
+    compiled = []
+    for field, prefix, suffix, *conditions in steps:
+        requires, unless = (*conditions, (), ())[:2]
+        compiled.append((
+            index(field), prefix, suffix,
+            tuple(index(name) for name in requires),
+            tuple(index(name) for name in unless)
+        ))
+    return tuple(compiled)
+
+
+def _render(author_str: str, entry: _PreparedEntry, template: Tuple) -> str:
+    """Render a prepared entry after its author string by walking a compiled template"""
+    parts = [author_str] if author_str else []
+    get = entry.__getitem__
+    for index, prefix, suffix, requires, unless in template:
+        value = entry[index]
+        if not value:
+            continue
+        if requires and not all(map(get, requires)):
+            continue
+        if unless and any(map(get, unless)):
+            continue
+        if prefix[:1] == '.' and (not parts or parts[-1].endswith('.')):
+            # Reuse the period already ending the previous part; a first part needs no separator
+            prefix = prefix[1:] if parts else prefix[1:].lstrip()
+        parts.append(f"{prefix}{value}{suffix}")
+    if not parts or not parts[-1].endswith('.'):
+        parts.append('.')
+    return ''.join(parts).strip()
+
+
+# Style templates: a step is emitted when its field is set, every `requires` field is
+# set and no `unless` field is set. A prefix starting with '.' begins a new sentence.
+_APA_JOURNAL_TEMPLATE = _template(
+    ('year', ' (', ')'),
+    ('title', '. ', ''),
+    ('journal', '. ', ''),
+    ('volume', ', ', '', ('journal',)),
+    ('issue', '(', ')', ('journal', 'volume')),
+    ('pages', ', ', '', ('journal',)),
+    ('end_page', '-', '', ('journal', 'pages')),
+    ('doi', '. https://doi.org/', ''),
+    ('url', '. ', '', (), ('doi',)),
+)
+
+_APA_BOOK_TEMPLATE = _template(
+    ('year', ' (', ')'),
+    ('title', '. ', ''),
+    ('publisher', '. ', ''),
+)
+
+_APA_OTHER_TEMPLATE = _template(
+    ('year', ' (', ')'),
+    ('title', '. ', ''),
+    ('journal', '. ', ''),
+    ('doi', '. https://doi.org/', ''),
+    ('url', '. ', '', (), ('doi',)),
+)
+
+_APA_TEMPLATES = {'JOUR': _APA_JOURNAL_TEMPLATE, 'BOOK': _APA_BOOK_TEMPLATE}
+
+_MLA_TEMPLATE = _template(
+    ('title', '. "', '"'),
+    ('journal', '. ', ''),
+    ('volume', ', vol. ', '', ('journal',)),
+    ('issue', ', no. ', '', ('journal', 'volume')),
+    ('year', ', ', '', ('journal',)),
+    ('pages', ', pp. ', '', ('journal', 'end_page')),
+    ('end_page', '-', '', ('journal', 'pages')),
+    ('pages', ', p. ', '', ('journal',), ('end_page',)),
+    ('year', '. ', '', (), ('journal',)),
+    ('doi', ', https://doi.org/', ''),
+    ('url', ', ', '', (), ('doi',)),
+)
+
+_CHICAGO_TEMPLATE = _template(
+    ('title', '. "', '"'),
+    ('journal', '. ', ''),
+    ('volume', ' ', '', ('journal',)),
+    ('issue', ', no. ', '', ('journal', 'volume')),
+    ('year', ' (', ')', ('journal',)),
+    ('pages', ': ', '', ('journal',)),
+    ('end_page', '-', '', ('journal', 'pages')),
+    ('year', '. ', '', (), ('journal',)),
+    ('doi', '. https://doi.org/', ''),
+    ('url', '. ', '', (), ('doi',)),
+)
+
+_HARVARD_TEMPLATE = _template(
+    ('year', ' ', ''),
+    ('title', ', ', ''),
+    ('journal', ', ', ''),
+    ('volume', ', ', '', ('journal',)),
+    ('issue', '(', ')', ('journal', 'volume')),
+    ('pages', ', pp.', '', ('journal', 'end_page')),
+    ('end_page', '-', '', ('journal', 'pages')),
+    ('pages', ', p.', '', ('journal',), ('end_page',)),
+    ('doi', ', DOI: ', ''),
+    ('url', ', Available at: ', '', (), ('doi',)),
+)
+
+_IEEE_TEMPLATE = _template(
+    ('title', ', "', '"'),
+    ('journal', ', ', ''),
+    ('volume', ', vol. ', '', ('journal',)),
+    ('issue', ', no. ', '', ('journal', 'volume')),
+    ('pages', ', pp. ', '', ('journal',)),
+    ('end_page', '-', '', ('journal', 'pages')),
+    ('year', ', ', ''),
+    ('doi', ', doi: ', ''),
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_author_list(authors: Tuple[str, ...], style: CitationStyle) -> str:
+    """Format an author tuple according to citation style (cached across a batch)"""
+    if not authors:
+        return _UNKNOWN
+    
+    count = len(authors)
+    if count == 1:
+        return authors[0]
+    
+    if style == CitationStyle.APA:
+        if count == 2:
+            return f"{authors[0]}, & {authors[1]}"
+        elif count <= 7:
+            return f"{', '.join(authors[:-1])}, & {authors[-1]}"
+        else:
+            return f"{', '.join(islice(authors, 6))}, ... {authors[-1]}"
+    
+    elif style == CitationStyle.MLA:
+        if count == 2:
+            return f"{authors[0]} and {authors[1]}"
+        else:
+            return f"{', '.join(authors[:-1])}, and {authors[-1]}"
+    
+    elif style == CitationStyle.CHICAGO:
+        if count == 2:
+            return f"{authors[0]} and {authors[1]}"
+        elif count <= 10:
+            return f"{', '.join(authors[:-1])}, and {authors[-1]}"
+        else:
+            return f"{', '.join(islice(authors, 10))}, et al."
+    
+    elif style == CitationStyle.HARVARD:
+        if count <= 3:
+            return f"{', '.join(authors[:-1])} & {authors[-1]}"
+        else:
+            return f"{authors[0]} et al."
+    
+    elif style == CitationStyle.IEEE:
+        if count <= 6:
+            return ', '.join(authors)
+        else:
+            return f"{', '.join(islice(authors, 6))} et al."
+    
+    return ', '.join(authors)
+
+
 class CitationFormatter:
     """Formats RIS entries according to different citation styles"""
     
     @staticmethod
     def format_authors(authors: List[str], style: CitationStyle) -> str:
         """Format author list according to citation style"""
-        if not authors:
-            return "Unknown Author"
-        
-        if style == CitationStyle.APA:
-            if len(authors) == 1:
-                return authors[0]
-            elif len(authors) <= 7:
-                if len(authors) == 2:
-                    return f"{authors[0]}, & {authors[1]}"
-                else:
-                    return ', '.join(authors[:-1]) + ', & ' + authors[-1]
-            else:
-                return ', '.join(authors[:6]) + ', ... ' + authors[-1]
-        
-        elif style == CitationStyle.MLA:
-            if len(authors) == 1:
-                return authors[0]
-            elif len(authors) == 2:
-                return f"{authors[0]} and {authors[1]}"
-            else:
-                return ', '.join(authors[:-1]) + ', and ' + authors[-1]
-        
-        elif style == CitationStyle.CHICAGO:
-            if len(authors) == 1:
-                return authors[0]
-            elif len(authors) <= 10:
-                if len(authors) == 2:
-                    return f"{authors[0]} and {authors[1]}"
-                else:
-                    return ', '.join(authors[:-1]) + ', and ' + authors[-1]
-            else:
-                return ', '.join(authors[:10]) + ', et al.'
-        
-        elif style == CitationStyle.HARVARD:
-            if len(authors) == 1:
-                return authors[0]
-            elif len(authors) <= 3:
-                return ', '.join(authors[:-1]) + ' & ' + authors[-1]
-            else:
-                return authors[0] + ' et al.'
-        
-        elif style == CitationStyle.IEEE:
-            if len(authors) == 1:
-                return authors[0]
-            elif len(authors) <= 6:
-                return ', '.join(authors)
-            else:
-                return ', '.join(authors[:6]) + ' et al.'
-        
-        return ', '.join(authors)
+        return _format_author_list(tuple(authors or ()), style)
     
     @staticmethod
-    def format_apa(entry: Dict[str, Union[str, List[str], int]]) -> str:
+    def format_apa(entry: Union[Dict[str, Union[str, List[str], int]], _PreparedEntry]) -> str:
         """Format citation in APA 7th edition style"""
-        authors = entry.get('authors', [])
-        title = entry.get('title', '')
-        journal = entry.get('journal_name', '') or entry.get('secondary_title', '')
-        year = entry.get('year', '')
-        volume = entry.get('volume', '')
-        issue = entry.get('number', '')
-        pages = entry.get('start_page', '')
-        end_page = entry.get('end_page', '')
-        doi = entry.get('doi', '')
-        url = entry.get('url', '')
-        entry_type = entry.get('type_of_reference', 'JOUR')
-        
-        author_str = CitationFormatter.format_authors(authors, CitationStyle.APA)
-        
-        if entry_type == 'JOUR':
-            citation = f"{author_str}"
-            if year:
-                citation += f" ({year})"
-            if title:
-                citation += f". {title}"
-            if journal:
-                citation += f". {journal}"
-                if volume:
-                    citation += f", {volume}"
-                    if issue:
-                        citation += f"({issue})"
-                if pages:
-                    if end_page:
-                        citation += f", {pages}-{end_page}"
-                    else:
-                        citation += f", {pages}"
-            if doi:
-                citation += f". https://doi.org/{doi}"
-            elif url:
-                citation += f". {url}"
-            citation += "."
-        
-        elif entry_type == 'BOOK':
-            publisher = entry.get('publisher', '')
-            city = entry.get('place_published', '')
-            citation = f"{author_str}"
-            if year:
-                citation += f" ({year})"
-            if title:
-                citation += f". {title}"
-            if city and publisher:
-                citation += f". {publisher}"
-            elif publisher:
-                citation += f". {publisher}"
-            citation += "."
+        e = _prepare(entry)
         
-        else:
-            citation = f"{author_str}"
-            if year:
-                citation += f" ({year})"
-            if title:
-                citation += f". {title}"
-            if journal:
-                citation += f". {journal}"
-            if doi:
-                citation += f". https://doi.org/{doi}"
-            elif url:
-                citation += f". {url}"
-            citation += "."
-        
-        return citation.replace("..", ".").strip()
+        author_str = CitationFormatter.format_authors(e.authors, CitationStyle.APA) if e.authors else _UNKNOWN
+        return _render(author_str, e, _APA_TEMPLATES.get(e.entry_type, _APA_OTHER_TEMPLATE))
     
     @staticmethod
-    def format_mla(entry: Dict[str, Union[str, List[str], int]]) -> str:
+    def format_mla(entry: Union[Dict[str, Union[str, List[str], int]], _PreparedEntry]) -> str:
         """Format citation in MLA 9th edition style"""
-        authors = entry.get('authors', [])
-        title = entry.get('title', '')
-        journal = entry.get('journal_name', '') or entry.get('secondary_title', '')
-        year = entry.get('year', '')
-        volume = entry.get('volume', '')
-        issue = entry.get('number', '')
-        pages = entry.get('start_page', '')
-        end_page = entry.get('end_page', '')
-        doi = entry.get('doi', '')
-        url = entry.get('url', '')
-        
-        author_str = CitationFormatter.format_authors(authors, CitationStyle.MLA)
+        e = _prepare(entry)
         
-        citation = f"{author_str}"
-        if title:
-            citation += f'. "{title}"'
-        if journal:
-            citation += f". {journal}"
-            if volume and issue:
-                citation += f", vol. {volume}, no. {issue}"
-            elif volume:
-                citation += f", vol. {volume}"
-            if year:
-                citation += f", {year}"
-            if pages:
-                if end_page:
-                    citation += f", pp. {pages}-{end_page}"
-                else:
-                    citation += f", p. {pages}"
-        elif year:
-            citation += f". {year}"
-        if doi:
-            citation += f", https://doi.org/{doi}"
-        elif url:
-            citation += f", {url}"
-        citation += "."
-        
-        return citation.replace("..", ".").strip()
+        author_str = CitationFormatter.format_authors(e.authors, CitationStyle.MLA) if e.authors else _UNKNOWN
+        return _render(author_str, e, _MLA_TEMPLATE)
     
     @staticmethod
-    def format_chicago(entry: Dict[str, Union[str, List[str], int]]) -> str:
+    def format_chicago(entry: Union[Dict[str, Union[str, List[str], int]], _PreparedEntry]) -> str:
         """Format citation in Chicago 17th edition style"""
-        authors = entry.get('authors', [])
-        title = entry.get('title', '')
-        journal = entry.get('journal_name', '') or entry.get('secondary_title', '')
-        year = entry.get('year', '')
-        volume = entry.get('volume', '')
-        issue = entry.get('number', '')
-        pages = entry.get('start_page', '')
-        end_page = entry.get('end_page', '')
-        doi = entry.get('doi', '')
-        url = entry.get('url', '')
-        
-        author_str = CitationFormatter.format_authors(authors, CitationStyle.CHICAGO)
+        e = _prepare(entry)
         
-        citation = f"{author_str}"
-        if title:
-            citation += f'. "{title}"'
-        if journal:
-            citation += f". {journal}"
-            if volume and issue:
-                citation += f" {volume}, no. {issue}"
-            elif volume:
-                citation += f" {volume}"
-            if year:
-                citation += f" ({year})"
-            if pages:
-                if end_page:
-                    citation += f": {pages}-{end_page}"
-                else:
-                    citation += f": {pages}"
-        elif year:
-            citation += f". {year}"
-        if doi:
-            citation += f". https://doi.org/{doi}"
-        elif url:
-            citation += f". {url}"
-        citation += "."
-        
-        return citation.replace("..", ".").strip()
+        author_str = CitationFormatter.format_authors(e.authors, CitationStyle.CHICAGO) if e.authors else _UNKNOWN
+        return _render(author_str, e, _CHICAGO_TEMPLATE)
     
     @staticmethod
-    def format_harvard(entry: Dict[str, Union[str, List[str], int]]) -> str:
+    def format_harvard(entry: Union[Dict[str, Union[str, List[str], int]], _PreparedEntry]) -> str:
         """Format citation in Harvard style"""
-        authors = entry.get('authors', [])
-        title = entry.get('title', '')
-        journal = entry.get('journal_name', '') or entry.get('secondary_title', '')
-        year = entry.get('year', '')
-        volume = entry.get('volume', '')
-        issue = entry.get('number', '')
-        pages = entry.get('start_page', '')
-        end_page = entry.get('end_page', '')
-        doi = entry.get('doi', '')
-        url = entry.get('url', '')
-        
-        author_str = CitationFormatter.format_authors(authors, CitationStyle.HARVARD)
+        e = _prepare(entry)
         
-        citation = f"{author_str}"
-        if year:
-            citation += f" {year}"
-        if title:
-            citation += f", {title}"
-        if journal:
-            citation += f", {journal}"
-            if volume:
-                citation += f", {volume}"
-                if issue:
-                    citation += f"({issue})"
-            if pages:
-                if end_page:
-                    citation += f", pp.{pages}-{end_page}"
-                else:
-                    citation += f", p.{pages}"
-        if doi:
-            citation += f", DOI: {doi}"
-        elif url:
-            citation += f", Available at: {url}"
-        citation += "."
-        
-        return citation.replace("..", ".").strip()
+        author_str = CitationFormatter.format_authors(e.authors, CitationStyle.HARVARD) if e.authors else _UNKNOWN
+        return _render(author_str, e, _HARVARD_TEMPLATE)
     
     @staticmethod
-    def format_ieee(entry: Dict[str, Union[str, List[str], int]]) -> str:
+    def format_ieee(entry: Union[Dict[str, Union[str, List[str], int]], _PreparedEntry]) -> str:
         """Format citation in IEEE style"""
-        authors = entry.get('authors', [])
-        title = entry.get('title', '')
-        journal = entry.get('journal_name', '') or entry.get('secondary_title', '')
-        year = entry.get('year', '')
-        volume = entry.get('volume', '')
-        issue = entry.get('number', '')
-        pages = entry.get('start_page', '')
-        end_page = entry.get('end_page', '')
-        doi = entry.get('doi', '')
-        
-        author_str = CitationFormatter.format_authors(authors, CitationStyle.IEEE)
-        
-        citation = f"{author_str}"
-        if title:
-            citation += f', "{title}"'
-        if journal:
-            citation += f", {journal}"
-            if volume:
-                citation += f", vol. {volume}"
-                if issue:
-                    citation += f", no. {issue}"
-            if pages:
-                if end_page:
-                    citation += f", pp. {pages}-{end_page}"
-                else:
-                    citation += f", pp. {pages}"
-            if year:
-                citation += f", {year}"
-        elif year:
-            citation += f", {year}"
-        if doi:
-            citation += f", doi: {doi}"
-        citation += "."
+        e = _prepare(entry)
         
-        return citation.replace("..", ".").strip()
+        author_str = CitationFormatter.format_authors(e.authors, CitationStyle.IEEE) if e.authors else _UNKNOWN
+        return _render(author_str, e, _IEEE_TEMPLATE)
     
     @staticmethod
-    def format(entry: Dict[str, Union[str, List[str], int]], style: CitationStyle = CitationStyle.APA) -> str:
+    def format(entry: Union[Dict[str, Union[str, List[str], int]], _PreparedEntry], style: CitationStyle = CitationStyle.APA) -> str:
         """Format citation according to specified style"""
         try:
-            if style == CitationStyle.APA:
-                return CitationFormatter.format_apa(entry)
-            elif style == CitationStyle.MLA:
-                return CitationFormatter.format_mla(entry)
-            elif style == CitationStyle.CHICAGO:
-                return CitationFormatter.format_chicago(entry)
-            elif style == CitationStyle.HARVARD:
-                return CitationFormatter.format_harvard(entry)
-            elif style == CitationStyle.IEEE:
-                return CitationFormatter.format_ieee(entry)
-            else:
-                return CitationFormatter.format_apa(entry)
+            return CitationFormatter._DISPATCH.get(style, CitationFormatter.format_apa)(_prepare(entry))
         except Exception as e:
             return f"Error formatting reference: {str(e)}"
+    
+    @staticmethod
+    def format_cached(entry: Dict[str, Union[str, List[str], int]], style: CitationStyle = CitationStyle.APA) -> str:
+        """Format citation like format(), memoized on the fields the formatters read"""
+        prepared = _prepare(entry)
+        try:
+            return _format_prepared(prepared, style)
+        except TypeError:
+            # A field holds an unhashable value (e.g. a list); format it without the cache
+            return CitationFormatter.format(prepared, style)
+
+
+@lru_cache(maxsize=8192)
+def _format_prepared(entry: _PreparedEntry, style: CitationStyle) -> str:
+    """Format a hashable prepared entry; identical references are only formatted once per style"""
+    return CitationFormatter.format(entry, style)
+
+
+# Style -> formatter table, filled in once the staticmethods exist
+CitationFormatter._DISPATCH = {
+    CitationStyle.APA: CitationFormatter.format_apa,
+    CitationStyle.MLA: CitationFormatter.format_mla,
+    CitationStyle.CHICAGO: CitationFormatter.format_chicago,
+    CitationStyle.HARVARD: CitationFormatter.format_harvard,
+    CitationStyle.IEEE: CitationFormatter.format_ieee,
+}
@@ -0,0 +1,138 @@
+"""
+Fast line-oriented RIS parser
+Parses the fixed `XX  - value` tag layout by slicing lines instead of matching patterns
+"""
+from typing import Dict, Iterable, Iterator, List, Union
+
+START_TAG = 'TY'
+END_TAG = 'ER'
+UNKNOWN_KEY = 'unknown_tag'
+
+# RIS tag to reference field name (same field names rispy produces)
+TAG_MAP = {
+    'TY': 'type_of_reference',
+    'A1': 'first_authors',
+    'A2': 'secondary_authors',
+    'A3': 'tertiary_authors',
+    'A4': 'subsidiary_authors',
+    'AB': 'abstract',
+    'AD': 'author_address',
+    'AN': 'accession_number',
+    'AU': 'authors',
+    'C1': 'custom1',
+    'C2': 'custom2',
+    'C3': 'custom3',
+    'C4': 'custom4',
+    'C5': 'custom5',
+    'C6': 'custom6',
+    'C7': 'custom7',
+    'C8': 'custom8',
+    'CA': 'caption',
+    'CN': 'call_number',
+    'CY': 'place_published',
+    'DA': 'date',
+    'DB': 'name_of_database',
+    'DO': 'doi',
+    'DP': 'database_provider',
+    'ET': 'edition',
+    'EP': 'end_page',
+    'ID': 'id',
+    'IS': 'number',
+    'J2': 'alternate_title1',
+    'JA': 'alternate_title2',
+    'JF': 'alternate_title3',
+    'JO': 'journal_name',
+    'KW': 'keywords',
+    'L1': 'file_attachments1',
+    'L2': 'file_attachments2',
+    'L4': 'figure',
+    'LA': 'language',
+    'LB': 'label',
+    'M1': 'note',
+    'M3': 'type_of_work',
+    'N1': 'notes',
+    'N2': 'notes_abstract',
+    'NV': 'number_of_volumes',
+    'OP': 'original_publication',
+    'PB': 'publisher',
+    'PY': 'year',
+    'RI': 'reviewed_item',
+    'RN': 'research_notes',
+    'RP': 'reprint_edition',
+    'SE': 'section',
+    'SN': 'issn',
+    'SP': 'start_page',
+    'ST': 'short_title',
+    'T1': 'primary_title',
+    'T2': 'secondary_title',
+    'T3': 'tertiary_title',
+    'TA': 'translated_author',
+    'TI': 'title',
+    'TT': 'translated_title',
+    'UR': 'urls',
+    'VL': 'volume',
+    'Y1': 'publication_year',
+    'Y2': 'access_date',
+}
+
+# Tags that may repeat and are collected into lists
+LIST_TAGS = frozenset({'A1', 'A2', 'A3', 'A4', 'AU', 'KW', 'N1', 'UR'})
+
+# Tags holding several values separated by a delimiter
+DELIMITED_TAGS = {'UR': ';'}
+
+
+def _add_value(record: Dict, tag: str, value: str, continuation: bool = False) -> None:
+    """Store a tag value in the record, following rispy's merge rules"""
+    name = TAG_MAP.get(tag)
+    if name is None:
+        record.setdefault(UNKNOWN_KEY, {}).setdefault(tag, []).append(value)
+        return
+
+    delimiter = DELIMITED_TAGS.get(tag)
+    if tag in LIST_TAGS:
+        values = [v.strip() for v in value.split(delimiter)] if delimiter else [value]
+        existing = record.get(name)
+        if existing is None:
+            record[name] = values
+        else:
+            existing.extend(values)
+    elif continuation:
+        # Wrapped line: append to the value started on the tag line
+        if name in record:
+            record[name] = f"{record[name]} {value}"
+    elif name not in record:
+        # Repeated single-value tags keep their first value
+        record[name] = value
+
+
+def iter_entries(lines: Iterable[str]) -> Iterator[Dict[str, Union[str, List[str]]]]:
+    """Yield one reference dictionary per TY ... ER block"""
+    record = None
+    last_tag = None
+
+    for line in lines:
+        if record is None:
+            # Skip anything between records until the next start tag
+            if line.startswith(START_TAG):
+                record = {TAG_MAP[START_TAG]: line[6:].strip()}
+                last_tag = None
+            continue
+
+        tag = line[:2]
+        if line[2:5] == '  -' and tag.isupper() and tag[:1].isalpha():
+            if tag == END_TAG:
+                yield record
+                record = None
+            else:
+                _add_value(record, tag, line[6:].strip())
+                last_tag = tag
+        else:
+            value = line.strip()
+            if value and last_tag is not None:
+                _add_value(record, last_tag, value, continuation=True)
+
+
+def load(lines: Iterable[str]) -> List[Dict[str, Union[str, List[str]]]]:
+    """Parse all RIS entries from an iterable of lines (e.g. a text stream)"""
+    return list(iter_entries(lines))
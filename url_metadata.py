@@ -3,21 +3,87 @@ URL metadata extraction module
 Handles extraction of citation metadata from various URL types including arXiv, DOI, and general web pages
 """
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, List
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import SplitResult, urlparse, urlsplit, parse_qs
 from datetime import datetime
 
+# Patterns compiled once at import instead of on every extraction
+# New-style arXiv ID as a whole path segment, found with a single scan of the path
+_ARXIV_ID_RE = re.compile(r'(?:^|/)(\d{4}\.\d{4,5}(?:v\d+)?)(?=/|$)')
+_AUTHOR_META_RE = re.compile(r'author', re.I)
+_DATE_META_RE = re.compile(r'date', re.I)
+_TITLE_PREFIX_RE = re.compile(r'^\[.*?\]\s*')
+# Four-digit year anywhere in a free-form date string
+_YEAR_RE = re.compile(r'\b(1[5-9][0-9]{2}|20[0-9]{2})\b')
+
+# arXiv Atom feed lookups, compiled once
+_ATOM_ENTRY_TAG = '{http://www.w3.org/2005/Atom}entry'
+_ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom', 'arxiv': 'http://arxiv.org/schemas/atom'}
+_ATOM_TITLE = etree.XPath('string(atom:title)', namespaces=_ATOM_NS, smart_strings=False)
+_ATOM_AUTHOR_NAMES = etree.XPath('atom:author/atom:name[1]', namespaces=_ATOM_NS)
+_ATOM_PUBLISHED = etree.XPath('string(atom:published)', namespaces=_ATOM_NS, smart_strings=False)
+_ATOM_SUMMARY = etree.XPath('string(atom:summary)', namespaces=_ATOM_NS, smart_strings=False)
+_ATOM_PRIMARY_CATEGORY = etree.XPath('string(arxiv:primary_category/@term)', namespaces=_ATOM_NS, smart_strings=False)
+
+# PubMed efetch lookups, compiled once
+_PUBMED_TITLE = etree.XPath('string(.//ArticleTitle)', smart_strings=False)
+_PUBMED_AUTHORS = etree.XPath('.//Author')
+_PUBMED_YEAR = etree.XPath('string(.//PubDate/Year)', smart_strings=False)
+_PUBMED_JOURNAL = etree.XPath('string(.//Journal/Title)', smart_strings=False)
+
+
+def _parse_year(date_str: str) -> str:
+    """Return the year of an ISO 8601 or free-form date string, or '' if it has none"""
+    try:
+        return str(datetime.fromisoformat(date_str.replace('Z', '+00:00')).year)
+    except ValueError:
+        # Not ISO 8601 (e.g. "5 March 2017", "2017/03/05"): take the first plausible year
+        match = _YEAR_RE.search(date_str)
+        return match.group(1) if match else ''
+
+
+def _in_domain(host: Optional[str], domain: str) -> bool:
+    """Check whether a (lowercased, port-free) host name is domain or one of its subdomains"""
+    return bool(host) and (host == domain or host.endswith('.' + domain))
+
+
+class _NoMetadata(Exception):
+    """Raised when an API has no usable record, so the miss is not cached"""
+
 
 class URLMetadataExtractor:
     """Extract metadata from URLs for citation purposes"""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_workers: int = 8):
         self.timeout = timeout
+        self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Pooled keep-alive connections, with a couple of retries on connection errors.
+        # 429/503 responses are returned as-is: honouring their Retry-After would sleep
+        # for as long as the server asks, regardless of the request timeout.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, respect_retry_after_header=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Successful lookups are memoized by identifier (not URL); the caches live on
+        # the instance so they are released with it. Misses raise and are not cached.
+        self._resolve_arxiv = lru_cache(maxsize=2048)(self._fetch_arxiv)
+        self._resolve_doi = lru_cache(maxsize=2048)(self._fetch_doi)
+        self._resolve_pubmed = lru_cache(maxsize=2048)(self._fetch_pubmed)
     
     def extract(self, url: str) -> Dict[str, any]:
         """Extract metadata from URL"""
@@ -25,245 +91,298 @@ class URLMetadataExtractor:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        # Handle special URL types
-        if 'arxiv.org' in url:
-            return self._extract_arxiv(url)
-        elif 'doi.org' in url or '/doi/' in url:
-            return self._extract_doi(url)
-        elif 'pubmed.ncbi.nlm.nih.gov' in url:
-            return self._extract_pubmed(url)
+        # Split once; the helpers read the path without query or fragment
+        parts = urlsplit(url)
+        
+        # Handle special URL types by host (or a parent domain of it), then publisher-hosted DOI paths
+        host = parts.hostname or ''
+        handler = None
+        while host and handler is None:
+            handler = self._HOST_HANDLERS.get(host)
+            host = host.partition('.')[2]
+        if handler is not None:
+            return handler(self, url, parts)
+        elif '/doi/' in parts.path:
+            return self._extract_doi(url, parts)
         else:
             return self._extract_generic(url)
     
-    def _extract_arxiv(self, url: str) -> Dict[str, any]:
+    def extract_many(self, urls: List[str]) -> List[Dict[str, any]]:
+        """Extract metadata for several URLs concurrently, preserving input order"""
+        if len(urls) <= 1:
+            return [self.extract(url) for url in urls]
+        
+        # Requests are I/O bound, so threads sharing the pooled session overlap the waits
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            return list(executor.map(self.extract, urls))
+    
+    def _from_cache(self, resolver, key: str, url: str) -> Optional[Dict[str, any]]:
+        """Return a copy of the memoized record for key with url set, or None when there is no record"""
+        try:
+            cached = resolver(key)
+        except _NoMetadata:
+            return None
+        # Copy the record and its authors list so callers can modify them
+        return {**cached, 'authors': list(cached['authors']), 'url': url}
+    
+    def _extract_arxiv(self, url: str, parts: SplitResult) -> Dict[str, any]:
         """Extract metadata from arXiv URL"""
         try:
-            # Extract arXiv ID from URL
+            # Extract arXiv ID from URL path
+            path = parts.path
             arxiv_id = None
-            if '/abs/' in url:
-                arxiv_id = url.split('/abs/')[-1].split('?')[0].split('#')[0]
-            elif '/pdf/' in url:
-                arxiv_id = url.split('/pdf/')[-1].split('.pdf')[0].split('?')[0]
-            elif '/e-print/' in url:
-                arxiv_id = url.split('/e-print/')[-1].split('?')[0]
+            if '/abs/' in path:
+                arxiv_id = path.rsplit('/abs/', 1)[-1]
+            elif '/pdf/' in path:
+                arxiv_id = path.rsplit('/pdf/', 1)[-1].removesuffix('.pdf')
+            elif '/e-print/' in path:
+                arxiv_id = path.rsplit('/e-print/', 1)[-1]
             
             if not arxiv_id:
-                # Try to extract from URL path
-                parts = urlparse(url).path.split('/')
-                for part in parts:
-                    if re.match(r'^\d{4}\.\d{4,5}(v\d+)?$', part):
-                        arxiv_id = part
-                        break
+                # Try to extract from URL path segments
+                match = _ARXIV_ID_RE.search(path)
+                if match:
+                    arxiv_id = match.group(1)
             
             if not arxiv_id:
                 return self._create_fallback_entry(url, 'arXiv paper')
             
-            # Use arXiv API
-            api_url = f'http://export.arxiv.org/api/query?id_list={arxiv_id}'
-            response = self.session.get(api_url, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(response.content)
-                
-                # Parse arXiv XML response
-                entry = root.find('{http://www.w3.org/2005/Atom}entry')
-                if entry is not None:
-                    title_elem = entry.find('{http://www.w3.org/2005/Atom}title')
-                    title = title_elem.text.strip() if title_elem is not None and title_elem.text else ''
-                    
-                    # Remove arXiv title prefix
-                    title = re.sub(r'^\[.*?\]\s*', '', title)
-                    
-                    # Extract authors
-                    authors = []
-                    for author in entry.findall('{http://www.w3.org/2005/Atom}author'):
-                        name_elem = author.find('{http://www.w3.org/2005/Atom}name')
-                        if name_elem is not None and name_elem.text:
-                            authors.append(name_elem.text.strip())
-                    
-                    # Extract published date
-                    published_elem = entry.find('{http://www.w3.org/2005/Atom}published')
-                    year = ''
-                    if published_elem is not None and published_elem.text:
-                        try:
-                            date = datetime.fromisoformat(published_elem.text.replace('Z', '+00:00'))
-                            year = str(date.year)
-                        except:
-                            pass
-                    
-                    # Extract abstract
-                    summary_elem = entry.find('{http://www.w3.org/2005/Atom}summary')
-                    abstract = summary_elem.text.strip() if summary_elem is not None and summary_elem.text else ''
-                    
-                    # Extract primary category
-                    primary_category = ''
-                    primary_elem = entry.find('{http://arxiv.org/schemas/atom}primary_category')
-                    if primary_elem is not None:
-                        primary_category = primary_elem.get('term', '')
-                    
-                    return {
-                        'type_of_reference': 'JOUR',
-                        'authors': authors,
-                        'title': title,
-                        'year': year,
-                        'journal_name': f'arXiv preprint arXiv:{arxiv_id}',
-                        'url': url,
-                        'doi': '',
-                        'abstract': abstract,
-                        'primary_category': primary_category,
-                        'arxiv_id': arxiv_id
-                    }
-            
+            reference = self._from_cache(self._resolve_arxiv, arxiv_id, url)
+            if reference is not None:
+                return reference
+        
         except Exception as e:
             print(f"Error extracting arXiv metadata: {e}")
         
         # Fallback: try to extract from PDF metadata or HTML
         return self._extract_generic(url)
     
-    def _extract_doi(self, url: str) -> Dict[str, any]:
+    def _fetch_arxiv(self, arxiv_id: str) -> Dict[str, any]:
+        """Look up arXiv metadata by identifier, raising _NoMetadata when there is no record"""
+        # Use arXiv API
+        api_url = f'http://export.arxiv.org/api/query?id_list={arxiv_id}'
+        
+        # Parse the streamed arXiv XML response, stopping once the first entry is complete
+        entry = None
+        with self.session.get(api_url, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                entries = etree.iterparse(response.raw, events=('end',), tag=_ATOM_ENTRY_TAG,
+                                          resolve_entities=False, no_network=True)
+                _, entry = next(entries, (None, None))
+        
+        if entry is not None:
+            # Remove arXiv title prefix
+            title = _TITLE_PREFIX_RE.sub('', _ATOM_TITLE(entry).strip())
+            
+            # Extract authors
+            authors = [name.text.strip() for name in _ATOM_AUTHOR_NAMES(entry) if name.text]
+            
+            # Extract the year from the published timestamp
+            published = _ATOM_PUBLISHED(entry)
+            year = _parse_year(published) if published else ''
+            
+            # Extract abstract and primary category
+            abstract = _ATOM_SUMMARY(entry).strip()
+            primary_category = _ATOM_PRIMARY_CATEGORY(entry)
+            
+            return {
+                'type_of_reference': 'JOUR',
+                'authors': authors,
+                'title': title,
+                'year': year,
+                'journal_name': f'arXiv preprint arXiv:{arxiv_id}',
+                'url': '',
+                'doi': '',
+                'abstract': abstract,
+                'primary_category': primary_category,
+                'arxiv_id': arxiv_id
+            }
+    
+        raise _NoMetadata(arxiv_id)
+    
+    def _extract_doi(self, url: str, parts: SplitResult) -> Dict[str, any]:
         """Extract metadata from DOI URL"""
         try:
-            # Extract DOI from URL
+            # Extract DOI from URL path
             doi = None
-            if 'doi.org/' in url:
-                doi = url.split('doi.org/')[-1].split('?')[0].split('#')[0]
-            elif '/doi/' in url:
-                doi = url.split('/doi/')[-1].split('?')[0].split('#')[0]
+            if _in_domain(parts.hostname, 'doi.org'):
+                doi = parts.path.lstrip('/')
+            elif '/doi/' in parts.path:
+                doi = parts.path.rsplit('/doi/', 1)[-1]
             
             if not doi:
                 return self._create_fallback_entry(url, 'DOI document')
             
-            # Use CrossRef API
-            crossref_url = f'https://api.crossref.org/works/{doi}'
-            response = self.session.get(crossref_url, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'message' in data:
-                    msg = data['message']
-                    
-                    # Extract title
-                    title = ''
-                    if 'title' in msg and msg['title']:
-                        title = ' '.join(msg['title'])
-                    
-                    # Extract authors
-                    authors = []
-                    if 'author' in msg:
-                        for author in msg['author']:
-                            given = author.get('given', '')
-                            family = author.get('family', '')
-                            if family:
-                                author_name = f"{family}, {given}".strip(', ')
-                                authors.append(author_name)
-                    
-                    # Extract year
-                    year = ''
-                    if 'published-print' in msg and msg['published-print'].get('date-parts'):
-                        year = str(msg['published-print']['date-parts'][0][0])
-                    elif 'published-online' in msg and msg['published-online'].get('date-parts'):
-                        year = str(msg['published-online']['date-parts'][0][0])
-                    
-                    # Extract journal
-                    journal = ''
-                    if 'container-title' in msg and msg['container-title']:
-                        journal = ' '.join(msg['container-title'])
-                    
-                    # Extract volume and pages
-                    volume = str(msg.get('volume', '')) if msg.get('volume') else ''
-                    pages = ''
-                    if 'page' in msg:
-                        pages = str(msg['page'])
-                    
-                    return {
-                        'type_of_reference': 'JOUR',
-                        'authors': authors,
-                        'title': title,
-                        'year': year,
-                        'journal_name': journal,
-                        'volume': volume,
-                        'start_page': pages,
-                        'url': url,
-                        'doi': doi
-                    }
+            reference = self._from_cache(self._resolve_doi, doi, url)
+            if reference is not None:
+                return reference
         
         except Exception as e:
             print(f"Error extracting DOI metadata: {e}")
         
         return self._extract_generic(url)
     
-    def _extract_pubmed(self, url: str) -> Dict[str, any]:
+    def _fetch_doi(self, doi: str) -> Dict[str, any]:
+        """Look up DOI metadata by identifier, raising _NoMetadata when there is no record"""
+        # Use CrossRef API
+        crossref_url = f'https://api.crossref.org/works/{doi}'
+        response = self.session.get(crossref_url, timeout=self.timeout)
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            if 'message' in data:
+                msg = data['message']
+                
+                # Extract title
+                title = ''
+                if 'title' in msg and msg['title']:
+                    title = ' '.join(msg['title'])
+                
+                # Extract authors
+                authors = []
+                if 'author' in msg:
+                    for author in msg['author']:
+                        given = author.get('given', '')
+                        family = author.get('family', '')
+                        if family:
+                            author_name = f"{family}, {given}".strip(', ')
+                            authors.append(author_name)
+                
+                # Extract year
+                year = ''
+                if 'published-print' in msg and msg['published-print'].get('date-parts'):
+                    year = str(msg['published-print']['date-parts'][0][0])
+                elif 'published-online' in msg and msg['published-online'].get('date-parts'):
+                    year = str(msg['published-online']['date-parts'][0][0])
+                
+                # Extract journal
+                journal = ''
+                if 'container-title' in msg and msg['container-title']:
+                    journal = ' '.join(msg['container-title'])
+                
+                # Extract volume and pages
+                volume = str(msg.get('volume', '')) if msg.get('volume') else ''
+                pages = ''
+                if 'page' in msg:
+                    pages = str(msg['page'])
+                
+                return {
+                    'type_of_reference': 'JOUR',
+                    'authors': authors,
+                    'title': title,
+                    'year': year,
+                    'journal_name': journal,
+                    'volume': volume,
+                    'start_page': pages,
+                    'url': '',
+                    'doi': doi
+                }
+        
+        raise _NoMetadata(doi)
+    
+    def _extract_pubmed(self, url: str, parts: SplitResult) -> Dict[str, any]:
         """Extract metadata from PubMed URL"""
         try:
-            # Extract PubMed ID
+            # Extract PubMed ID (last path segment, ignoring a trailing slash)
             pm_id = None
-            if 'pubmed.ncbi.nlm.nih.gov' in url:
-                pm_id = url.split('/')[-1].split('?')[0].split('#')[0]
+            if _in_domain(parts.hostname, 'pubmed.ncbi.nlm.nih.gov'):
+                pm_id = parts.path.rstrip('/').rsplit('/', 1)[-1]
             
             if not pm_id or not pm_id.isdigit():
                 return self._create_fallback_entry(url, 'PubMed article')
             
-            # Use PubMed API
-            api_url = f'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=pubmed&id={pm_id}&retmode=xml'
-            response = self.session.get(api_url, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(response.content)
-                
-                # Parse PubMed XML
-                article = root.find('.//PubmedArticle')
-                if article is not None:
-                    # Extract title
-                    title_elem = article.find('.//ArticleTitle')
-                    title = title_elem.text if title_elem is not None and title_elem.text else ''
-                    
-                    # Extract authors
-                    authors = []
-                    for author in article.findall('.//Author'):
-                        last_name = author.find('LastName')
-                        first_name = author.find('ForeName')
-                        if last_name is not None and last_name.text:
-                            name = last_name.text
-                            if first_name is not None and first_name.text:
-                                name += f", {first_name.text}"
-                            authors.append(name)
-                    
-                    # Extract year
-                    year = ''
-                    pub_date = article.find('.//PubDate/Year')
-                    if pub_date is not None and pub_date.text:
-                        year = pub_date.text
-                    
-                    # Extract journal
-                    journal_elem = article.find('.//Journal/Title')
-                    journal = journal_elem.text if journal_elem is not None and journal_elem.text else ''
-                    
-                    return {
-                        'type_of_reference': 'JOUR',
-                        'authors': authors,
-                        'title': title,
-                        'year': year,
-                        'journal_name': journal,
-                        'url': url,
-                        'doi': ''
-                    }
+            reference = self._from_cache(self._resolve_pubmed, pm_id, url)
+            if reference is not None:
+                return reference
         
         except Exception as e:
             print(f"Error extracting PubMed metadata: {e}")
         
         return self._extract_generic(url)
     
+    def _fetch_pubmed(self, pm_id: str) -> Dict[str, any]:
+        """Look up PubMed metadata by identifier, raising _NoMetadata when there is no record"""
+        # Use PubMed API
+        api_url = f'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=pubmed&id={pm_id}&retmode=xml'
+        
+        # Parse the streamed PubMed XML, stopping after the first Article element so the
+        # MeSH headings and reference lists that follow it are never downloaded or built
+        article = None
+        with self.session.get(api_url, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                for _, elem in etree.iterparse(response.raw, events=('end',), tag=('Article', 'AbstractText'),
+                                               resolve_entities=False, no_network=True):
+                    if elem.tag == 'Article':
+                        article = elem
+                        break
+                    if elem.tag == 'AbstractText':
+                        # Abstracts are not used; drop their text early
+                        elem.clear()
+        
+        if article is not None:
+            # Extract title, including any inline markup such as <i>
+            title = _PUBMED_TITLE(article)
+            
+            # Extract authors
+            authors = []
+            for author in _PUBMED_AUTHORS(article):
+                last_name = author.find('LastName')
+                first_name = author.find('ForeName')
+                if last_name is not None and last_name.text:
+                    name = last_name.text
+                    if first_name is not None and first_name.text:
+                        name += f", {first_name.text}"
+                    authors.append(name)
+            
+            # Extract year and journal
+            year = _PUBMED_YEAR(article)
+            journal = _PUBMED_JOURNAL(article)
+            
+            return {
+                'type_of_reference': 'JOUR',
+                'authors': authors,
+                'title': title,
+                'year': year,
+                'journal_name': journal,
+                'url': '',
+                'doi': ''
+            }
+        
+        raise _NoMetadata(pm_id)
+
     def _extract_generic(self, url: str) -> Dict[str, any]:
         """Extract metadata from generic web page"""
         try:
-            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
-            if response.status_code != 200:
-                return self._create_fallback_entry(url, 'Web page')
+            # Stream so error responses are closed without downloading their body
+            with self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True) as response:
+                if response.status_code != 200:
+                    return self._create_fallback_entry(url, 'Web page')
+                html = response.content
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            from bs4 import BeautifulSoup, SoupStrainer
+            # lxml's C parser, building only the tags read below instead of the whole page
+            metadata_tags = SoupStrainer(['title', 'meta', 'script'])
+            soup = BeautifulSoup(html, 'lxml', parse_only=metadata_tags)
+            
+            # Read the meta tags in one pass, keeping the first tag for each property/name
+            properties = {}
+            names = {}
+            author_contents = []
+            date_content = None
+            for meta in soup.find_all('meta'):
+                content = meta.get('content', '')
+                prop = meta.get('property')
+                if prop is not None:
+                    properties.setdefault(prop, content)
+                name = meta.get('name')
+                if name is not None:
+                    names.setdefault(name, content)
+                    if content and _AUTHOR_META_RE.search(name):
+                        author_contents.append(content)
+                    if date_content is None and _DATE_META_RE.search(name):
+                        date_content = content
             
             # Extract title
             title = ''
@@ -272,24 +391,17 @@ class URLMetadataExtractor:
             
             # Try meta tags
             if not title:
-                meta_title = soup.find('meta', property='og:title')
-                if meta_title and meta_title.get('content'):
-                    title = meta_title['content']
+                title = properties.get('og:title', '')
             
             if not title:
-                meta_title = soup.find('meta', {'name': 'title'})
-                if meta_title and meta_title.get('content'):
-                    title = meta_title['content']
+                title = names.get('title', '')
             
             # Extract authors from meta tags
             authors = []
-            author_meta = soup.find_all('meta', {'name': re.compile(r'author', re.I)})
-            for meta in author_meta:
-                content = meta.get('content', '')
-                if content:
-                    # Split multiple authors
-                    for author in content.split(','):
-                        authors.append(author.strip())
+            for author_content in author_contents:
+                # Split multiple authors
+                for author in author_content.split(','):
+                    authors.append(author.strip())
             
             # Try to find authors in structured data
             if not authors:
@@ -297,8 +409,7 @@ class URLMetadataExtractor:
                 json_scripts = soup.find_all('script', type='application/ld+json')
                 for script in json_scripts:
                     try:
-                        import json
-                        data = json.loads(script.string)
+                        data = orjson.loads(script.get_text())
                         if isinstance(data, dict):
                             if 'author' in data:
                                 author_data = data['author']
@@ -319,41 +430,18 @@ class URLMetadataExtractor:
             
             # Extract date
             year = ''
-            date_meta = soup.find('meta', property='article:published_time')
-            if date_meta and date_meta.get('content'):
-                try:
-                    date_str = date_meta['content']
-                    date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    year = str(date.year)
-                except:
-                    pass
+            published_time = properties.get('article:published_time')
+            if published_time:
+                year = _parse_year(published_time)
             
-            if not year:
-                date_meta = soup.find('meta', {'name': re.compile(r'date', re.I)})
-                if date_meta and date_meta.get('content'):
-                    try:
-                        date_str = date_meta['content']
-                        # Try to parse various date formats
-                        for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%d %B %Y', '%B %d, %Y']:
-                            try:
-                                date = datetime.strptime(date_str[:10], fmt)
-                                year = str(date.year)
-                                break
-                            except:
-                                continue
-                    except:
-                        pass
+            if not year and date_content:
+                year = _parse_year(date_content)
             
             # Extract description/abstract
-            description = ''
-            desc_meta = soup.find('meta', property='og:description')
-            if desc_meta and desc_meta.get('content'):
-                description = desc_meta['content']
+            description = properties.get('og:description', '')
             
             if not description:
-                desc_meta = soup.find('meta', {'name': 'description'})
-                if desc_meta and desc_meta.get('content'):
-                    description = desc_meta['content']
+                description = names.get('description', '')
             
             return {
                 'type_of_reference': 'ELEC',
@@ -382,3 +470,12 @@ class URLMetadataExtractor:
             'url': url,
             'doi': ''
         }
+
+
+# Domain -> extraction method, filled in once the methods exist; subdomains
+# (www., export.arxiv.org, dx.doi.org, ...) use their parent domain's entry
+URLMetadataExtractor._HOST_HANDLERS = {
+    'arxiv.org': URLMetadataExtractor._extract_arxiv,
+    'doi.org': URLMetadataExtractor._extract_doi,
+    'pubmed.ncbi.nlm.nih.gov': URLMetadataExtractor._extract_pubmed,
+}